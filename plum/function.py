@@ -6,7 +6,7 @@ from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
 from .resolver import AmbiguousLookupError, NotFoundLookupError, Resolver
 from .signature import Signature, append_default_args, extract_signature
 from .type import resolve_type_hint
-from .util import TypeHint, repr_short
+from .util import Missing, TypeHint, repr_short
 
 __all__ = ["Function"]
 
@@ -105,6 +105,10 @@ class Function(metaclass=_FunctionMeta):
         self._resolver = Resolver()
         self._resolved: List[Tuple[Callable, Signature, int]] = []
 
+        # Memoised result of the MRO walk performed by
+        # :meth:`_handle_not_found_lookup_error`. `Missing` means not yet computed.
+        self._fallback_method = Missing
+
     @property
     def owner(self):
         """object or None: Owner of the function. If `None`, then there is no owner."""
@@ -235,6 +239,7 @@ class Function(metaclass=_FunctionMeta):
                 `True`.
         """
         self._cache.clear()
+        self._fallback_method = Missing
 
         if reregister:
             # Add all resolved to pending.
@@ -352,11 +357,24 @@ class Function(metaclass=_FunctionMeta):
             # Not in a class. Nothing we can do.
             raise ex
 
-        # In a class. Walk through the classes in the class's MRO, except for this
-        # class, and try to get the method.
-        method = None
-        return_type = object
+        # In a class. The fallback method only depends on the MRO of the owner, so
+        # the walk needs to happen only once.
+        if self._fallback_method is Missing:
+            self._fallback_method = self._find_fallback_method()
+
+        if not self._fallback_method:
+            # If no method has been found after walking through the MRO, raise the
+            # original exception.
+            raise ex
+        return self._fallback_method, object
 
+    def _find_fallback_method(self) -> Optional[Callable]:
+        """Walk through the classes in the owner's MRO, except for the owner itself,
+        and try to get the method.
+
+        Returns:
+            function or None: The fallback method, or `None` if there is none.
+        """
         for c in self.owner.__mro__[1:]:
             # Skip the top of the type hierarchy given by `object` and `type`. We do
             # not suddenly want to fall back to any unexpected default behaviour.
@@ -367,26 +385,12 @@ class Function(metaclass=_FunctionMeta):
             # `c.__le__` will return  even if `c` does not implement `__le__`!
             if self._f.__name__ in c.__dict__:
                 method = getattr(c, self._f.__name__)
-            else:
-                # For some reason, coverage fails to catch the `continue` below. Add
-                # the do-nothing `_ = None` fixes this.
-                # TODO: Remove this once coverage properly catches this.
-                _ = None
-                continue
-
-            # Ignore abstract methods.
-            if getattr(method, "__isabstractmethod__", False):
-                method = None
-                continue
-
-            # We found a good candidate. Break.
-            break
 
-        if not method:
-            # If no method has been found after walking through the MRO, raise the
-            # original exception.
-            raise ex
-        return method, return_type
+                # Ignore abstract methods.
+                if not getattr(method, "__isabstractmethod__", False):
+                    # We found a good candidate.
+                    return method
+        return None
 
     def __call__(self, *args, **kw_args):
         method, return_type = self._resolve_method_with_cache(args=args)
@@ -1,6 +1,8 @@
+import functools
 import pydoc
 import sys
-from typing import Callable, List, Tuple, Union
+import textwrap
+from typing import Callable, Dict, List, Sequence, Set, Tuple, Union
 
 from plum.signature import Signature
 
@@ -15,6 +17,27 @@ class NotFoundLookupError(LookupError):
     """A signature cannot be resolved because no applicable method can be found."""
 
 
+_plain_text_doc = pydoc._PlainTextDoc()
+""":class:`pydoc._PlainTextDoc`: Documenter without styling. This styling would
+display erroneously in Sphinx. The instance is created once and reused."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_function(f: Callable) -> str:
+    """Run the :mod:`pydoc` introspection for a function `f`.
+
+    This is the expensive part of generating documentation, so the result is cached.
+    The cache is cleared whenever a new signature is registered.
+
+    Args:
+        f (function): Function.
+
+    Returns:
+        str: Plain-text rendering of `f` produced by :mod:`pydoc`.
+    """
+    return _plain_text_doc.document(f)
+
+
 def _document(f: Callable) -> str:
     """Generate documentation for a function `f`.
 
@@ -34,17 +57,14 @@ def _document(f: Callable) -> str:
     Returns:
         str: Documentation for `f`.
     """
-    # :class:`pydoc._PlainTextDoc` removes styling. This styling will display
-    # erroneously in Sphinx.
-    parts = pydoc._PlainTextDoc().document(f).rstrip().split("\n")
+    text = _render_function(f).rstrip()
 
-    # Separate out the function definition and the lines corresponding to the body.
-    title = parts[0]
-    body = parts[1:]
+    # Separate out the function definition and the text corresponding to the body.
+    title, _, body = text.partition("\n")
 
-    # Remove indentation from every line of the body. This indentation defaults to
-    # four spaces.
-    body = [line[4:] for line in body]
+    # Remove the indentation from the body, which defaults to four spaces, in one
+    # pass rather than slicing every line individually.
+    body = textwrap.dedent(body)
 
     # If `sphinx` is imported, assume that we're building the documentation. In that
     # case, display the function definition in a nice way.
@@ -55,20 +75,27 @@ def _document(f: Callable) -> str:
     title += "\n"  # Add a newline to separate the title from the body.
 
     # Ensure that there are no trailing newlines. This can happen if the body is empty.
-    return "\n".join([title] + body).rstrip()
+    return (title + "\n" + body).rstrip()
 
 
 class Resolver:
     """Method resolver.
 
     Attributes:
-        signatures (list[:class:`.signature.Signature`]): Registered signatures.
+        signatures (list[:class:`.signature.Signature`]): Registered signatures,
+            topologically sorted with more specific signatures before more general
+            ones.
         is_faithful (bool): Whether all signatures are faithful or not.
     """
 
     def __init__(self):
         self.signatures: List[Signature] = []
         self.is_faithful: bool = True
+        self._unfaithful_count: int = 0
+        self._cache: Dict[Tuple[type, ...], Signature] = {}
+        self._single_dispatch: bool = True
+        self._type_index: Dict[type, Signature] = {}
+        self._more_specific_than: Dict[int, Set[int]] = {}
 
     def doc(self, exclude: Union[Callable, None] = None) -> str:
         """Concatenate the docstrings of all methods of this function. Remove duplicate
@@ -81,18 +108,21 @@ class Resolver:
         Returns:
             str: Concatenation of all docstrings.
         """
-        # Generate all docstrings, possibly excluding `exclude`.
-        docs = [
+        # Generate all docstrings lazily, possibly excluding `exclude`.
+        docs = (
             _document(sig.implementation)
             for sig in self.signatures
             if not (exclude and sig.implementation == exclude)
-        ]
+        )
         # This can yield duplicates, because of extra methods automatically generated by
         # :func:`.signature.append_default_args`. We remove these by simply only
-        # keeping unique docstrings.
+        # keeping unique docstrings. Track the docstrings seen so far in a set to keep
+        # the deduplication linear in the number of methods.
+        seen = set()
         unique_docs = []
         for d in docs:
-            if d not in unique_docs:
+            if d not in seen:
+                seen.add(d)
                 unique_docs.append(d)
         # The unique documentations have no trailing newlines, so separate them with
         # a newline.
@@ -104,19 +134,84 @@ class Resolver:
         Args:
             signature (:class:`.signature.Signature`): Signature to add.
         """
-        existing = [s == signature for s in self.signatures]
-        if any(existing):
-            if sum(existing) != 1:
+        # The types of the signature can no longer change, so precompute the fast
+        # path for matching, if there is one.
+        signature._compile_match()
+
+        # Collect the indices of all existing signatures equal to the new one in a
+        # single pass, rather than materialising a list of booleans and scanning it
+        # multiple times. Every `==` on a signature is two expensive `__le__` calls,
+        # so one pass matters.
+        existing = [i for i, s in enumerate(self.signatures) if s == signature]
+        if existing:
+            if len(existing) != 1:
                 raise AssertionError(
-                    f"The added signature `{signature}` is equal to {sum(existing)} "
+                    f"The added signature `{signature}` is equal to {len(existing)} "
                     f"existing signatures. This should never happen."
                 )
-            self.signatures[existing.index(True)] = signature
+            old = self.signatures[existing[0]]
+            self.signatures[existing[0]] = signature
+            # Update the faithfulness bookkeeping for the replaced signature.
+            if not old.is_faithful:
+                self._unfaithful_count -= 1
+            if not signature.is_faithful:
+                self._unfaithful_count += 1
+            # Equal signatures compare identically against all other signatures, so
+            # the topological order and the shape of the specificity DAG do not
+            # change. The DAG is keyed by identity, however, so move the edges of
+            # the old signature over to the new one.
+            if old is not signature:
+                old_id, new_id = id(old), id(signature)
+                self._more_specific_than[new_id] = self._more_specific_than.pop(old_id)
+                for more_specific in self._more_specific_than.values():
+                    if old_id in more_specific:
+                        more_specific.remove(old_id)
+                        more_specific.add(new_id)
         else:
-            self.signatures.append(signature)
-
-        # Use a double negation for slightly better performance.
-        self.is_faithful = not any(not s.is_faithful for s in self.signatures)
+            # Record which signatures are strictly more specific than which other
+            # ones. This is what makes resolution linear in the number of
+            # signatures rather than quadratic. At the same time, find where to
+            # insert the new signature: inserting it right before the first strictly
+            # more general signature maintains the topological order.
+            position = None
+            self._more_specific_than[id(signature)] = set()
+            for i, s in enumerate(self.signatures):
+                if s < signature:
+                    self._more_specific_than[id(signature)].add(id(s))
+                elif signature < s:
+                    self._more_specific_than[id(s)].add(id(signature))
+                    if position is None:
+                        position = i
+            if position is None:
+                self.signatures.append(signature)
+            else:
+                self.signatures.insert(position, signature)
+            if not signature.is_faithful:
+                self._unfaithful_count += 1
+
+        # The count of unfaithful signatures is maintained incrementally above,
+        # which avoids a scan over all signatures on every registration.
+        self.is_faithful = self._unfaithful_count == 0
+
+        # The newly registered signature might change how argument types resolve, so
+        # any previously cached resolutions are invalid.
+        self._cache.clear()
+
+        # The implementation behind a docstring might have changed, so clear the
+        # rendered documentation too.
+        _render_function.cache_clear()
+
+        # Maintain the index for the single-dispatch fast path. The fast path is only
+        # safe if every signature dispatches on just its first argument and annotates
+        # that argument with a plain class.
+        self._single_dispatch = all(
+            len(s.types) == 1 and not s.has_varargs and type(s.types[0]) is type
+            for s in self.signatures
+        )
+        if self._single_dispatch:
+            self._type_index = {s.types[0]: s for s in self.signatures}
+        else:
+            self._type_index = {}
 
     def __len__(self) -> int:
         return len(self.signatures)
@@ -132,50 +227,164 @@ class Resolver:
             :class:`.signature.Signature`: The most specific signature satisfying
                 `target`.
         """
-        if isinstance(target, tuple):
+        if isinstance(target, tuple) and self.is_faithful:
+            # If all signatures are faithful, then the resolution of a tuple of
+            # arguments is determined by the types of those arguments, so we can
+            # safely cache the result. For unfaithful signatures, whether arguments
+            # match can depend on more than just their types, so we cannot cache.
+            types = tuple(map(type, target))
+            # Signatures are never `None`, so `get` can be used instead of raising
+            # and catching a `KeyError`.
+            signature = self._cache.get(types)
+            if signature is not None:
+                return signature
+            signature = self._find_signature(target)
+            if signature is not None:
+                self._cache[types] = signature
+                return signature
+        else:
+            signature = self._find_signature(target)
+            if signature is not None:
+                return signature
 
-            def check(s):
-                # `target` are concrete arguments.
-                return s.match(target)
+        # There is no matching signature.
+        raise NotFoundLookupError(f"`{target}` could not be resolved.")
 
-        else:
+    def resolve_many(self, targets: Sequence[Tuple[object, ...]]) -> List[Signature]:
+        """Resolve multiple tuples of arguments at once.
+
+        The targets are grouped by the types of their arguments, and every group is
+        resolved only once. When the targets comprise only a few distinct type
+        tuples, this is substantially cheaper than calling :meth:`resolve` for every
+        target.
 
-            def check(s):
-                # `target` is a signature that must be encompassed.
-                return target <= s
+        Args:
+            targets (sequence[tuple[object]]): Targets to resolve. Every target must
+                be a tuple of arguments.
+
+        Returns:
+            list[:class:`.signature.Signature`]: For every target, the most specific
+                signature satisfying that target.
+        """
+        if not self.is_faithful:
+            # For unfaithful signatures, resolution can depend on more than just the
+            # types of the arguments, so every target must be resolved individually.
+            return [self.resolve(target) for target in targets]
+
+        # Group the targets by the types of their arguments.
+        groups: Dict[Tuple[type, ...], List[int]] = {}
+        for i, target in enumerate(targets):
+            groups.setdefault(tuple(map(type, target)), []).append(i)
+
+        # Resolve once per group, and scatter the result to all targets in the
+        # group.
+        results: List[Union[Signature, None]] = [None] * len(targets)
+        for indices in groups.values():
+            signature = self.resolve(targets[indices[0]])
+            for i in indices:
+                results[i] = signature
+        return results
+
+    def _find_signature_single_dispatch(self, t: type) -> Union[Signature, None]:
+        """Attempt to resolve a single argument of class `t` by walking the MRO of
+        `t`, which runs in time linear in the depth of the class hierarchy rather
+        than in the number of registered signatures.
+
+        Args:
+            t (type): Class of the argument.
+
+        Returns:
+            :class:`.signature.Signature` or None: The most specific signature for
+                `t`, or `None` if resolution must fall back to the general path.
+        """
+        type_index = self._type_index
+        hits = [c for c in t.__mro__ if c in type_index]
+        if not hits:
+            # Let the general path produce the `NotFoundLookupError`.
+            return None
+        # The first hit is the most specific signature only if every other hit is a
+        # strict superclass of it. Otherwise, e.g. in the case of multiple
+        # inheritance, the resolution might be ambiguous, so fall back to the
+        # general path.
+        if all(issubclass(hits[0], c) for c in hits[1:]):
+            return type_index[hits[0]]
+        return None
+
+    def _find_signature(
+        self, target: Union[Tuple[object, ...], Signature]
+    ) -> Union[Signature, None]:
+        """Find the most specific signature that satisfies a target without using the
+        cache.
 
+        Args:
+            target (:class:`.signature.Signature` or tuple[object]): Target to resolve.
+                Must be either a signature to be encompassed or a tuple of arguments.
+
+        Returns:
+            :class:`.signature.Signature` or None: The most specific signature
+                satisfying `target`, or `None` if there is no matching signature.
+                Returning `None` instead of raising keeps the common path of
+                :meth:`resolve` free of exception handling.
+        """
+        if self._single_dispatch and isinstance(target, tuple) and len(target) == 1:
+            # Every signature dispatches on just its first argument, so attempt to
+            # index directly by the class of the argument.
+            signature = self._find_signature_single_dispatch(type(target[0]))
+            if signature is not None:
+                return signature
+
+        # Bind attributes to locals: they are accessed once per registered signature
+        # below.
+        signatures = self.signatures
+        more_specific_than = self._more_specific_than
+
+        # Find all matching signatures, and discard those for which a strictly more
+        # specific signature also matches. Since `self.signatures` is topologically
+        # sorted, all signatures strictly more specific than a match have already
+        # been visited when that match is encountered, so a single forward pass
+        # suffices: a match is a candidate if and only if no current candidate is
+        # strictly more specific than it. The predicates are inlined per target
+        # kind to avoid a call through a generic check function.
         candidates = []
-        for signature in [s for s in self.signatures if check(s)]:
-            # If none of the candidates are comparable, then add the method as
-            # a new candidate and continue.
-            if not any(c.is_comparable(signature) for c in candidates):
-                candidates += [signature]
-                continue
-
-            # The signature under consideration is comparable with at least one
-            # of the candidates. First, filter any strictly more general candidates.
-            new_candidates = [c for c in candidates if not signature < c]
-
-            # If the signature under consideration is as specific as at least
-            # one candidate, then and only then add it as a candidate.
-            if any(signature <= c for c in candidates):
-                candidates = new_candidates + [signature]
-            else:
-                candidates = new_candidates
+        candidate_ids = set()
+        if isinstance(target, tuple):
+            # `target` are concrete arguments.
+            for s in signatures:
+                if s.match(target) and more_specific_than[id(s)].isdisjoint(
+                    candidate_ids
+                ):
+                    candidates.append(s)
+                    candidate_ids.add(id(s))
+        else:
+            # `target` is a signature that must be encompassed.
+            for s in signatures:
+                if target <= s and more_specific_than[id(s)].isdisjoint(candidate_ids):
+                    candidates.append(s)
+                    candidate_ids.add(id(s))
 
         if len(candidates) == 0:
-            # There is no matching signature.
-            raise NotFoundLookupError(f"`{target}` could not be resolved.")
+            # There is no matching signature. Let `resolve` raise the error.
+            return None
         elif len(candidates) == 1:
             # There is exactly one matching signature. Success!
             return candidates[0]
         else:
             # There are multiple matching signatures. Before raising an exception,
-            # attempt to resolve the ambiguity using the precedence of the signatures.
-            precedences = [c.precedence for c in candidates]
-            max_precendence = max(precedences)
-            if sum([p == max_precendence for p in precedences]) == 1:
-                return candidates[precedences.index(max_precendence)]
+            # attempt to resolve the ambiguity using the precedence of the
+            # signatures: if exactly one candidate attains the maximal precedence,
+            # then that candidate wins. Track the winner and the count in a single
+            # pass, stopping as soon as the maximum is attained twice.
+            max_precedence = max(c.precedence for c in candidates)
+            winner = None
+            count = 0
+            for c in candidates:
+                if c.precedence == max_precedence:
+                    winner = c
+                    count += 1
+                    if count > 1:
+                        break
+            if count == 1:
+                return winner
             else:
                 # Could not resolve the ambiguity, so error. First, make a nice list
                 # of the candidates and their precedences.
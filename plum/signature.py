@@ -56,6 +56,10 @@ class Signature(Comparable):
         varargs_are_faithful = self.varargs is Missing or is_faithful(self.varargs)
         self.is_faithful = types_are_faithful and varargs_are_faithful
 
+        # Set by :meth:`_compile_match` at registration time.
+        self._fast_match_types: Optional[Tuple[type, ...]] = None
+        self._fast_match_varargs: Optional[type] = None
+
     @property
     def has_varargs(self) -> bool:
         return self.varargs is not Missing
@@ -83,6 +87,21 @@ class Signature(Comparable):
             parts.append("implementation=" + repr(self.implementation))
         return "Signature(" + ", ".join(parts) + ")"
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if (
+            isinstance(other, Signature)
+            and self.types == other.types
+            and self.varargs == other.varargs
+        ):
+            # Structurally identical signatures are always equal. This avoids the
+            # two expensive `__le__` calls of the general path below for the common
+            # case of comparing against an identical signature, e.g. when
+            # re-registering a method.
+            return True
+        return Comparable.__eq__(self, other)
+
     def __hash__(self):
         return multihash(Signature, *self.types, self.varargs)
 
@@ -139,6 +158,25 @@ class Signature(Comparable):
             ]
         )
 
+    def _compile_match(self) -> None:
+        """Attempt to precompute a fast path for :meth:`match`.
+
+        If all types of this signature are plain classes, then matching a tuple of
+        values reduces to `isinstance` checks against those classes. This also works
+        in the presence of variable arguments, provided that those are annotated
+        with a plain class as well: the values beyond the fixed arguments are then
+        checked against that class. :meth:`.resolver.Resolver.register` calls this
+        once the types of the signature can no longer change.
+        """
+        self._fast_match_types = None
+        self._fast_match_varargs = None
+        if all(type(t) is type for t in self.types):
+            if not self.has_varargs:
+                self._fast_match_types = self.types
+            elif type(self.varargs) is type:
+                self._fast_match_types = self.types
+                self._fast_match_varargs = self.varargs
+
     def match(self, values) -> bool:
         """Check whether values match the signature.
 
@@ -148,6 +186,20 @@ class Signature(Comparable):
         Returns:
             bool: `True` if `values` match this signature and `False` otherwise.
         """
+        fast_match_types = self._fast_match_types
+        if fast_match_types is not None:
+            # The signature was precompiled: matching reduces to `isinstance` checks.
+            n = len(fast_match_types)
+            varargs = self._fast_match_varargs
+            if varargs is None:
+                if len(values) != n:
+                    return False
+            else:
+                if len(values) < n:
+                    return False
+                if not all(isinstance(v, varargs) for v in values[n:]):
+                    return False
+            return all(isinstance(v, t) for v, t in zip(values, fast_match_types))
         # `values` must either be exactly many as `self.types`. If there are more
         # `values`, then there must be variable arguments to cover the arguments.
         if not (
@@ -1,4 +1,5 @@
 import abc
+import functools
 import sys
 import typing
 from typing import Callable, List
@@ -72,7 +73,17 @@ def multihash(*args):
     Returns:
         int: Hash.
     """
-    return hash(args)
+    # If all arguments are classes which hash by identity, then mix their `id`s
+    # directly, which avoids dispatching to `__hash__` for every element. Classes
+    # which hash by identity also compare by identity, so this is consistent with
+    # the general case below.
+    for arg in args:
+        if type(arg).__hash__ is not type.__hash__:
+            return hash(args)
+    h = 0
+    for arg in args:
+        h = (h * 1000003) ^ id(arg)
+    return h
 
 
 class Comparable(metaclass=abc.ABCMeta):
@@ -92,13 +103,14 @@ class Comparable(metaclass=abc.ABCMeta):
         pass  # pragma: no cover
 
     def __lt__(self, other):
-        return self <= other and self != other
+        # Do not go through `__eq__`, which would call `__le__` twice more.
+        return self.__le__(other) and not other.__le__(self)
 
     def __ge__(self, other):
         return other.__le__(self)
 
     def __gt__(self, other):
-        return self >= other and self != other
+        return other.__le__(self) and not self.__le__(other)
 
     def is_comparable(self, other):
         """Check whether this object is comparable with another one.
@@ -109,19 +121,28 @@ class Comparable(metaclass=abc.ABCMeta):
         Returns:
             Whether the object is comparable with `other`.
         """
-        return self < other or self == other or self > other
+        # Two objects are comparable if and only if `__le__` holds in at least one
+        # direction, so two calls suffice.
+        return self.__le__(other) or other.__le__(self)
+
+
+def _call_unary(f: Callable, x):
+    """Call `f` with the single argument `x`. Used by :func:`wrap_lambda`."""
+    return f(x)
 
 
 def wrap_lambda(f: Callable) -> Callable:
-    """Wrap a callable in a lambda function.
+    """Wrap a callable in a function of one argument.
 
     Args:
         f (Callable): Function to wrap.
 
     Returns:
-        function: Wrapped version of `f`.
+        function: Wrapped version of `f`. This is a :func:`functools.partial`
+            which binds `f`, rather than a lambda: the partial is cheaper to
+            construct and calling it does not add a Python frame.
     """
-    return lambda x: f(x)
+    return functools.partial(_call_unary, f)
 
 
 def is_in_class(f: Callable) -> bool:
@@ -6,16 +6,18 @@ from plum.promotion import _convert, _promotion_rule
 
 @pytest.fixture
 def convert():
-    # Save methods.
+    # Save methods. Registrations only ever append to `_resolved`, so remembering
+    # its length suffices to restore the original methods and avoids copying the
+    # list on every test.
     _convert._resolve_pending_registrations()
-    resolved = list(_convert._resolved)
+    n_resolved = len(_convert._resolved)
 
     yield plum.convert
 
     # Clear methods after use.
     _convert._resolve_pending_registrations()
     _convert._pending = []
-    _convert._resolved = resolved
+    del _convert._resolved[n_resolved:]
     _convert.clear_cache(reregister=True)
 
 
@@ -23,11 +25,11 @@ def convert():
 def promote():
     # Save methods.
     _promotion_rule._resolve_pending_registrations()
-    resolved = list(_promotion_rule._resolved)
+    n_resolved = len(_promotion_rule._resolved)
 
     yield plum.promote
 
     # Clear methods after use.
     _promotion_rule._pending = []
-    _promotion_rule._resolved = resolved
+    del _promotion_rule._resolved[n_resolved:]
     _promotion_rule.clear_cache(reregister=True)
@@ -219,3 +219,114 @@ def test_resolve():
     assert r.resolve(s_c1) == s_b1
     s_b2.precedence = 2
     assert r.resolve(s_c1) == s_b2
+
+
+def test_resolve_many():
+    r = Resolver()
+    s_int = Signature(int)
+    s_float = Signature(float)
+    r.register(s_int)
+    r.register(s_float)
+
+    # Targets with the same argument types are resolved as a group.
+    targets = [(1,), (1.0,), (2,), (3,)]
+    assert r.resolve_many(targets) == [s_int, s_float, s_int, s_int]
+    assert r.resolve_many([]) == []
+
+    # Errors propagate like they do for `resolve`.
+    with pytest.raises(NotFoundLookupError):
+        r.resolve_many([(1,), ("1",)])
+
+    # When the resolver is unfaithful, targets are resolved individually.
+    s_tuple = Signature(typing.Tuple[int])
+    r.register(s_tuple)
+    assert not r.is_faithful
+    assert r.resolve_many([(1,), ((1,),)]) == [s_int, s_tuple]
+
+
+def test_more_specific_than_dag():
+    class A:
+        pass
+
+    class B(A):
+        pass
+
+    s_a = Signature(A)
+    s_b = Signature(B)
+    s_int = Signature(int)
+
+    r = Resolver()
+    r.register(s_a)
+    r.register(s_b)
+    r.register(s_int)
+    # More specific signatures must come before more general ones. Unrelated
+    # signatures remain in registration order.
+    assert r.signatures == [s_b, s_a, s_int]
+    assert r._more_specific_than == {
+        id(s_a): {id(s_b)},
+        id(s_b): set(),
+        id(s_int): set(),
+    }
+
+    # Replacing a signature with an equal one moves the edges over.
+    s_b2 = Signature(B)
+    r.register(s_b2)
+    assert r.signatures == [s_b2, s_a, s_int]
+    assert r._more_specific_than == {
+        id(s_a): {id(s_b2)},
+        id(s_b2): set(),
+        id(s_int): set(),
+    }
+
+
+def test_single_dispatch_index():
+    r = Resolver()
+    r.register(Signature(int))
+    assert r._single_dispatch
+    assert r._type_index == {int: r.signatures[0]}
+
+    # A signature with more than one argument disables the fast path.
+    r.register(Signature(int, float))
+    assert not r._single_dispatch
+    assert r._type_index == {}
+
+    # So does a signature with variable arguments...
+    r = Resolver()
+    r.register(Signature(int, varargs=int))
+    assert not r._single_dispatch
+
+    # ...and a signature whose argument is not a plain class.
+    r = Resolver()
+    r.register(Signature(typing.Optional[int]))
+    assert not r._single_dispatch
+
+
+def test_resolve_cache():
+    r = Resolver()
+    s_int = Signature(int)
+    s_float = Signature(float)
+    r.register(s_int)
+    r.register(s_float)
+
+    # The cache starts out empty.
+    assert r._cache == {}
+
+    # Resolving a tuple of arguments populates the cache, and the cached entry
+    # resolves correctly.
+    assert r.resolve((1,)) == s_int
+    assert r._cache == {(int,): s_int}
+    assert r.resolve((1,)) == s_int
+
+    # Resolving a signature does not populate the cache.
+    assert r.resolve(s_float) == s_float
+    assert r._cache == {(int,): s_int}
+
+    # Registering a new signature invalidates the cache.
+    r.register(Signature(str))
+    assert r._cache == {}
+
+    # If the resolver is unfaithful, then the cache cannot be used.
+    r.register(Signature(typing.Tuple[int]))
+    assert not r.is_faithful
+    assert r.resolve((1,)) == s_int
+    assert r._cache == {}
@@ -157,6 +157,37 @@ def test_match():
     assert not Sig(int, varargs=int).match(())
 
 
+def test_compile_match():
+    # All types are plain classes, so matching can be precompiled.
+    s = Sig(int, str)
+    assert s._fast_match_types is None
+    s._compile_match()
+    assert s._fast_match_types == (int, str)
+    assert s.match((1, "1"))
+    assert not s.match((1, 2))
+    assert not s.match((1,))
+
+    # Variable arguments annotated with a plain class can also be precompiled.
+    s = Sig(int, varargs=int)
+    s._compile_match()
+    assert s._fast_match_types == (int,)
+    assert s._fast_match_varargs is int
+    assert s.match((1,))
+    assert s.match((1, 2, 3))
+    assert not s.match(())
+    assert not s.match((1, 2.0))
+
+    # Variable arguments which are not a plain class cannot be precompiled.
+    s = Sig(int, varargs=Tuple[int])
+    s._compile_match()
+    assert s._fast_match_types is None
+
+    # Neither can types which are not plain classes.
+    s = Sig(Tuple[int])
+    s._compile_match()
+    assert s._fast_match_types is None
+
+
 def test_inspect_signature():
     assert isinstance(_inspect_signature(lambda x: x), inspect.Signature)
     assert len(_inspect_signature(lambda x: x).parameters) == 1
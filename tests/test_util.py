@@ -46,6 +46,11 @@ def test_multihash():
     assert multihash(2, 2) != multihash(1, 2)
     assert multihash(2, 1) != multihash(1, 2)
 
+    # Classes take the identity-based fast path and must remain order sensitive.
+    assert multihash(int, float) == multihash(int, float)
+    assert multihash(float, float) != multihash(int, float)
+    assert multihash(float, int) != multihash(int, float)
+
 
 class Number(Comparable):
     def __init__(self, x):